@@ -6,6 +6,7 @@ configuring the application behavior.
 """
 
 import argparse
+import sys
 
 
 def parse_args() -> argparse.Namespace:
@@ -41,7 +42,21 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Show memory usage statistics for duplicate-finding algorithm",
     )
+    # getrusage() is POSIX-only, so Windows can only trace allocations
+    on_windows = sys.platform == "win32"
+    parser.add_argument(
+        "--mem-profile-mode",
+        choices=("tracemalloc",) if on_windows else ("rusage", "tracemalloc"),
+        default="tracemalloc" if on_windows else "rusage",
+        help="Memory profiling backend: process peak RSS (rusage, low overhead) or "
+        "per-allocation Python tracing (tracemalloc, detailed but slow)",
+    )
     parser.add_argument(
         "--input-file", type=str, help="Path to a file containing one input per line"
     )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse results for repeated short inputs instead of re-running the algorithm",
+    )
     return parser.parse_args()
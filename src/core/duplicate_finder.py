@@ -6,8 +6,99 @@ characters in input strings.
 """
 
 import logging
+import string
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from collections import Counter
+from functools import lru_cache
+from typing import List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Byte values that str.isspace() treats as whitespace within the ASCII range
+_ASCII_WHITESPACE = bytes(b for b in range(128) if chr(b).isspace())
+
+# Non-whitespace ASCII byte values probed by the long-input scan
+_ASCII_CANDIDATES = tuple(b for b in range(128) if b not in _ASCII_WHITESPACE)
+
+# Narrower candidate set for inputs made only of ASCII letters and whitespace
+_ASCII_LETTERS = tuple(string.ascii_letters.encode("ascii"))
+_ASCII_LETTERS_AND_WHITESPACE = bytes(_ASCII_LETTERS) + _ASCII_WHITESPACE
+
+# ASCII inputs at least this long are scanned per byte value instead of counted per character
+LONG_INPUT_THRESHOLD = 512
+
+
+def _scan_long_ascii(data: bytes) -> List[str]:
+    """
+    Find duplicate bytes by probing each candidate byte value with C-level searches.
+
+    The Python-level work is bounded by the number of candidate byte values rather
+    than by the input length, which beats a Counter on long inputs.
+
+    Args:
+        data: ASCII-encoded input text.
+
+    Returns:
+        Duplicate characters in first-seen order.
+    """
+    # Names are usually letters only; then just the 52 letter values need probing
+    if data.translate(None, _ASCII_LETTERS_AND_WHITESPACE):
+        candidates = _ASCII_CANDIDATES
+    else:
+        candidates = _ASCII_LETTERS
+
+    find = data.find
+    hits = []
+    for b in candidates:
+        # Only "seen twice" matters, so stop at the second occurrence instead of counting
+        first = find(b)
+        if first >= 0 and find(b, first + 1) >= 0:
+            hits.append((first, b))
+    hits.sort()
+    return [chr(b) for _, b in hits]
+
+
+def find_duplicates_fast(text: str) -> List[str]:
+    """
+    Find non-space characters that appear more than once in the input string.
+
+    Module-level form of HistogramDuplicateFinder.find_duplicates, for hot loops
+    that want to call the algorithm without going through a finder instance.
+
+    Args:
+        text: The input string to analyze for duplicate characters.
+
+    Returns:
+        A list of characters that appear more than once in the input string,
+        excluding spaces, in first-seen order.
+
+    Raises:
+        TypeError: If the input is not a string.
+
+    Example:
+        >>> find_duplicates_fast("banana")
+        ['a', 'n']
+    """
+    if not isinstance(text, str):
+        raise TypeError(f"Expected text as str, got {type(text).__name__}")
+
+    if logger.isEnabledFor(logging.DEBUG):
+        counts = Counter("".join(text.split()))
+        logger.debug("Character counts: %s", dict(counts))
+
+    # isascii() is a flag check on the str object, far cheaper than a failed encode
+    if not text.isascii():
+        # str.split() drops exactly the str.isspace() characters, entirely in C
+        histogram = Counter("".join(text.split()))
+        return [ch for ch, cnt in histogram.items() if cnt > 1]
+
+    data = text.encode("ascii")
+    if len(data) >= LONG_INPUT_THRESHOLD:
+        return _scan_long_ascii(data)
+
+    # ASCII fast path: strip whitespace with a single C-level translate
+    histogram = Counter(data.translate(None, _ASCII_WHITESPACE).decode("ascii"))
+    return [ch for ch, cnt in histogram.items() if cnt > 1]
 
 
 class DuplicateFinder(ABC):
@@ -40,16 +131,17 @@ class HistogramDuplicateFinder(DuplicateFinder):
     """
     Finds duplicates using a character frequency histogram approach.
 
-    This implementation builds a histogram of character occurrences in a single
-    pass and returns characters that appear multiple times.
+    Short and non-ASCII inputs are counted into a histogram of character occurrences
+    in a single pass. ASCII inputs of LONG_INPUT_THRESHOLD characters or more are
+    instead scanned once per candidate byte value, stopping at its second occurrence.
     """
 
     def find_duplicates(self, text: str) -> List[str]:
         """
         Find non-space characters that appear more than once in the input string.
 
-        This implementation creates a histogram of character occurrences and returns
-        a list of characters that appear multiple times, excluding spaces.
+        This implementation returns the characters that appear multiple times,
+        excluding spaces, in the order they are first seen.
 
         Args:
             text: The input string to analyze for duplicate characters.
@@ -68,14 +160,61 @@ class HistogramDuplicateFinder(DuplicateFinder):
             >>> finder.find_duplicates("hello world")
             ['l', 'o']
         """
+        return find_duplicates_fast(text)
+
+
+class CachedDuplicateFinder(DuplicateFinder):
+    """
+    Decorates another finder with an LRU cache keyed on the input text.
+
+    Batch inputs often contain the same line many times, so repeated texts are
+    answered from the cache instead of being scanned again. Only texts shorter
+    than max_length are cached, so long lines are not kept alive as cache keys.
+    """
+
+    def __init__(
+        self,
+        finder: DuplicateFinder,
+        maxsize: int = 4096,
+        max_length: int = LONG_INPUT_THRESHOLD,
+    ):
+        """
+        Initialize the caching finder.
+
+        Args:
+            finder: The finder whose results are cached.
+            maxsize: Maximum number of distinct inputs kept in the cache.
+            max_length: Texts of this length or longer bypass the cache.
+        """
+        self._max_length = max_length
+        self._find = finder.find_duplicates
+        self._cached_find = lru_cache(maxsize=maxsize)(self._find_tuple)
+
+    def _find_tuple(self, text: str) -> Tuple[str, ...]:
+        """Run the wrapped finder and freeze its result so it can be shared safely."""
+        return tuple(self._find(text))
+
+    def find_duplicates(self, text: str) -> List[str]:
+        """
+        Find non-space characters that appear more than once in the input string.
+
+        Args:
+            text: The input string to analyze for duplicate characters.
+
+        Returns:
+            A new list of characters that appear more than once in the input string,
+            excluding spaces.
+
+        Raises:
+            TypeError: If the input is not a string.
+        """
         if not isinstance(text, str):
             raise TypeError(f"Expected text as str, got {type(text).__name__}")
 
-        histogram: Dict[str, int] = {}
-        for ch in text:
-            if ch.isspace():
-                continue
-            histogram[ch] = histogram.get(ch, 0) + 1
-            logging.debug(f"Count for '{ch}': {histogram[ch]}")
+        if len(text) >= self._max_length:
+            return list(self._find(text))
+        return list(self._cached_find(text))
 
-        return [ch for ch, cnt in histogram.items() if cnt > 1]
+    def cache_clear(self) -> None:
+        """Drop all cached results."""
+        self._cached_find.cache_clear()
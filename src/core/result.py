@@ -19,12 +19,15 @@ class DuplicateResult:
         duplicates: List of characters that appear multiple times in the input.
         duration: Time in seconds that the algorithm took to run.
         memory_stats: Optional tuple of (current, peak) memory usage in bytes.
+        memory_labels: Summary labels for the two memory_stats values, which depend
+            on the profiler that produced them.
     """
 
     input_text: str
     duplicates: List[str]
     duration: float
     memory_stats: Optional[Tuple[int, int]] = None
+    memory_labels: Tuple[str, str] = ("Memory current usage", "Memory peak usage")
 
     def get_summary_lines(self) -> List[str]:
         """
@@ -41,6 +44,7 @@ class DuplicateResult:
         ]
         if self.memory_stats:
             current, peak = self.memory_stats
-            lines.append(f"Memory current usage   : {current/1024:.2f} KiB")
-            lines.append(f"Memory peak usage      : {peak/1024:.2f} KiB")
+            current_label, peak_label = self.memory_labels
+            lines.append(f"{current_label:<23}: {current/1024:.2f} KiB")
+            lines.append(f"{peak_label:<23}: {peak/1024:.2f} KiB")
         return lines
@@ -8,17 +8,46 @@ the components that find duplicates and visualize them.
 import argparse
 import logging
 import time
-from typing import List, Optional
+from typing import Iterable, Iterator, Optional
 
 from src.cli.parser import parse_args
-from src.core.duplicate_finder import DuplicateFinder, HistogramDuplicateFinder
+from src.core.duplicate_finder import (
+    CachedDuplicateFinder,
+    DuplicateFinder,
+    HistogramDuplicateFinder,
+)
 from src.core.result import DuplicateResult
-from src.profiling.memory_profiler import MemoryProfiler
+from src.profiling.memory_profiler import MemoryProfiler, RusageProfiler
 from src.ui.balloon_viz import BalloonVisualizer, NoAnimationVisualizer
 from src.ui.visualizer import Visualizer
 
+# Read buffer for --input-file; large sequential reads keep syscalls per line low
+_INPUT_BUFFER_SIZE = 1 << 20
 
-def get_inputs(args: argparse.Namespace) -> List[str]:
+
+def _iter_file_inputs(path: str) -> Iterator[str]:
+    """
+    Lazily yield the non-empty, stripped lines of an input file.
+
+    Lines are read one at a time so large files are never held in memory.
+
+    Args:
+        path: Path to the input file
+
+    Yields:
+        Each non-empty line with surrounding whitespace removed
+    """
+    try:
+        with open(path, "r", buffering=_INPUT_BUFFER_SIZE) as f:
+            for line in f:
+                text = line.strip()
+                if text:
+                    yield text
+    except Exception as e:
+        logging.error(f"Error reading file: {e}")
+
+
+def get_inputs(args: argparse.Namespace) -> Iterable[str]:
     """
     Get input strings from either file or interactive prompt.
 
@@ -26,15 +55,10 @@ def get_inputs(args: argparse.Namespace) -> List[str]:
         args: Command line arguments
 
     Returns:
-        A list of input strings to process
+        An iterable of input strings to process; file inputs are streamed lazily
     """
     if args.input_file:
-        try:
-            with open(args.input_file, "r") as f:
-                return [line.strip() for line in f if line.strip()]
-        except Exception as e:
-            logging.error(f"Error reading file: {e}")
-            return []
+        return _iter_file_inputs(args.input_file)
     else:
         user_input = input("Enter text: ").strip()
         if not user_input:
@@ -48,6 +72,7 @@ def process_input(
     finder: DuplicateFinder,
     visualizer: Visualizer,
     profiler: Optional[MemoryProfiler] = None,
+    fallback_visualizer: Optional[Visualizer] = None,
 ) -> None:
     """
     Process a single input string to find duplicates and visualize results.
@@ -56,36 +81,40 @@ def process_input(
         input_text: The string to analyze for duplicate characters
         finder: Component to find duplicates in the text
         visualizer: Component to visualize the results
-        profiler: Optional component to profile memory usage
+        profiler: Optional started component to profile memory usage
+        fallback_visualizer: Component used when the input is too long to animate;
+            a NoAnimationVisualizer is created if not given
     """
     # Skip long text animation if needed
-    should_skip_animation = len(input_text) > 30 and isinstance(visualizer, BalloonVisualizer)
+    should_skip_animation = len(input_text) > 30 and visualizer.animated
     if should_skip_animation:
         print(f"Warning: input length {len(input_text)} > 30, skipping balloon animation.")
 
-    # Start profiling if requested
+    # Begin a new profiling section; tracking itself is started once by the caller
     if profiler:
-        profiler.start()
+        profiler.reset_peak()
 
-    # Find duplicates and measure time
-    start = time.perf_counter()
+    # Find duplicates and measure time in integer nanoseconds
+    start = time.perf_counter_ns()
     duplicates = finder.find_duplicates(input_text)
-    duration = time.perf_counter() - start
+    duration = (time.perf_counter_ns() - start) / 1e9
 
     # Get memory stats if profiling
     memory_stats = None
     if profiler:
-        stats = profiler.stop()
+        stats = profiler.snapshot()
         memory_stats = (stats.current, stats.peak)
 
     # Create result object
     result = DuplicateResult(
         input_text=input_text, duplicates=duplicates, duration=duration, memory_stats=memory_stats
     )
+    if profiler:
+        result.memory_labels = profiler.labels
 
     # Visualize the results with appropriate visualizer
     if should_skip_animation:
-        NoAnimationVisualizer().visualize(result)
+        (fallback_visualizer or NoAnimationVisualizer()).visualize(result)
     else:
         visualizer.visualize(result)
 
@@ -106,23 +135,33 @@ def main() -> None:
     logging.basicConfig(level=log_level, format="%(message)s")
 
     # Create components based on arguments
-    finder = HistogramDuplicateFinder()
+    finder: DuplicateFinder = HistogramDuplicateFinder()
+    if args.cache:
+        finder = CachedDuplicateFinder(finder)
 
     float_time = 0.05 if args.fast else 0.1
 
     # Explicitly type the visualizer variable to the interface type
     visualizer: Visualizer
+    summary_visualizer = NoAnimationVisualizer()
     if args.no_animation:
-        visualizer = NoAnimationVisualizer()
+        visualizer = summary_visualizer
     else:
         visualizer = BalloonVisualizer(float_time, args.height)
 
-    profiler = MemoryProfiler() if args.mem_profile else None
+    profiler: Optional[MemoryProfiler] = None
+    if args.mem_profile:
+        profiler = RusageProfiler() if args.mem_profile_mode == "rusage" else MemoryProfiler()
 
-    # Get inputs and process each one
-    inputs = get_inputs(args)
-    for input_text in inputs:
-        process_input(input_text, finder, visualizer, profiler)
+    # Get inputs and process each one as it is read, sharing the components across inputs
+    if profiler:
+        profiler.start()
+    try:
+        for input_text in get_inputs(args):
+            process_input(input_text, finder, visualizer, profiler, summary_visualizer)
+    finally:
+        if profiler:
+            profiler.stop()
 
 
 if __name__ == "__main__":
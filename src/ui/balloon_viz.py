@@ -5,16 +5,22 @@ This module provides concrete visualizer implementations that show duplicates
 as animated balloons in the terminal or as a simple text summary.
 """
 
-import curses
-import random
+from __future__ import annotations
+
+import string
+import sys
 import time
-from typing import List, Tuple
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from src.core.result import DuplicateResult
 from src.ui.visualizer import Visualizer
 
-# Type alias for the curses window
-CursesWindow = curses.window
+# curses and random are imported where they are used, so text-only runs never load them
+if TYPE_CHECKING:
+    import curses
+
+    # Type alias for the curses window
+    CursesWindow = curses.window
 
 # Pre-defined ASCII balloon art
 BALLOON_ART = [
@@ -28,6 +34,21 @@ BALLOON_ART = [
 ]
 
 
+def _render_balloon(ch: str) -> Tuple[str, ...]:
+    """Return the balloon art lines with the given character filled in."""
+    return tuple(line.format(ch) for line in BALLOON_ART)
+
+
+# Balloon art for every printable, non-whitespace ASCII character, rendered once at import
+_RENDERED = {ch: _render_balloon(ch) for ch in string.printable if not ch.isspace()}
+
+
+def _print_summary(summary_lines: List[str]) -> None:
+    """Print the text summary block to stdout with a single write."""
+    body = "".join(f"  {line}\n" for line in summary_lines)
+    sys.stdout.write(f"\nSummary:\n{body}\n---\n\n")
+
+
 class BalloonVisualizer(Visualizer):
     """
     Visualizer that displays duplicate characters as animated balloons.
@@ -36,6 +57,8 @@ class BalloonVisualizer(Visualizer):
     visualizations in the terminal.
     """
 
+    animated = True
+
     def __init__(self, float_time: float, height: int):
         """
         Initialize the balloon visualizer.
@@ -54,16 +77,17 @@ class BalloonVisualizer(Visualizer):
         Args:
             result: The result object containing duplicates to visualize.
         """
+        # Format the summary once for whichever branch displays it
+        summary_lines = result.get_summary_lines()
         if not result.duplicates:
             # No duplicates to show - just print the summary
-            print("\nSummary:")
-            for line in result.get_summary_lines():
-                print(f"  {line}")
-            print("\n---\n")
+            _print_summary(summary_lines)
             return
 
         # Use curses for the animation
-        curses.wrapper(self._curses_balloons, result.duplicates, result.get_summary_lines())
+        import curses
+
+        curses.wrapper(self._curses_balloons, result.duplicates, summary_lines)
 
     def _curses_balloons(
         self,
@@ -79,14 +103,22 @@ class BalloonVisualizer(Visualizer):
             duplicates: List of characters to display in balloons.
             summary_lines: List of strings to display as summary after animation.
         """
+        import curses
+
         self._setup_curses(stdscr)
         positions = self._calculate_balloon_positions(stdscr, duplicates, summary_lines)
-        self._animate_balloons(stdscr, positions)
-        self._display_final_screen(stdscr, positions, summary_lines)
+        # Fetch each balloon and its colour once and share them between the animation
+        # and the final screen
+        rendered = [_RENDERED.get(ch) or _render_balloon(ch) for ch in duplicates]
+        color_pairs = [curses.color_pair((idx % 5) + 1) for idx in range(len(duplicates))]
+        self._animate_balloons(stdscr, positions, rendered, color_pairs)
+        self._display_final_screen(stdscr, positions, rendered, color_pairs, summary_lines)
         self._wait_for_key(stdscr)
 
     def _setup_curses(self, stdscr: CursesWindow) -> None:
         """Set up the curses environment for animation."""
+        import curses
+
         curses.curs_set(0)
         stdscr.nodelay(True)
         curses.start_color()
@@ -107,43 +139,92 @@ class BalloonVisualizer(Visualizer):
 
     def _calculate_balloon_positions(
         self, stdscr: CursesWindow, duplicates: List[str], summary_lines: List[str]
-    ) -> List[Tuple[int, int, str, int]]:
-        """Calculate the starting positions for each balloon."""
+    ) -> Tuple[int, List[int]]:
+        """
+        Calculate the starting positions for each balloon.
+
+        Returns:
+            The row shared by every balloon and each balloon's column, indexed like
+            duplicates.
+        """
+        import random
+
         max_y, max_x = stdscr.getmaxyx()
         num = len(duplicates)
         balloon_width = len(BALLOON_ART[0])
         slot_width = max_x // num if num else max_x
 
-        positions = []
+        # Leave room below the balloons for the summary and a blank separator line
         y_start = max_y - len(BALLOON_ART) - len(summary_lines) - 2
-        for idx, ch in enumerate(duplicates):
-            min_x = idx * slot_width
-            max_x_slot = min_x + slot_width - balloon_width
-            x = random.randint(min_x, max_x_slot) if max_x_slot > min_x else min_x
-            positions.append((y_start, x, ch, idx))
 
-        return positions
+        # Every slot has the same slack, so draw all random offsets in a single call
+        slack = slot_width - balloon_width
+        offsets = random.choices(range(slack + 1), k=num) if slack > 0 else [0] * num
+
+        return y_start, [idx * slot_width + offset for idx, offset in enumerate(offsets)]
 
     def _animate_balloons(
-        self, stdscr: CursesWindow, positions: List[Tuple[int, int, str, int]]
+        self,
+        stdscr: CursesWindow,
+        positions: Tuple[int, List[int]],
+        rendered: List[Tuple[str, ...]],
+        color_pairs: List[int],
     ) -> None:
         """Animate the balloons rising to their final positions."""
         max_y, max_x = stdscr.getmaxyx()
+        art_height = len(BALLOON_ART)
+        y0, xs = positions
+
+        # Pair each on-screen balloon with its art and colour once, not once per frame
+        balloons = [
+            (x0, art, color_pair)
+            for x0, art, color_pair in zip(xs, rendered, color_pairs)
+            if 0 <= x0 < max_x
+        ]
+
+        # Let curses use the terminal's own line insert/delete when scrolling
+        stdscr.idlok(True)
+
+        # Schedule frames against fixed deadlines so drawing time does not add up as drift
+        start = time.monotonic()
+        last_step = self.height - 1
+        drawn_step: Optional[int] = None
         for step in range(self.height):
-            stdscr.erase()
-            for y0, x0, ch, idx in positions:
-                y = y0 - step
-                color_pair = curses.color_pair((idx % 5) + 1)
-                for dy, line in enumerate(BALLOON_ART):
-                    if 0 <= y + dy < max_y and 0 <= x0 < max_x:
-                        stdscr.addstr(y + dy, x0, line.format(ch), color_pair)
+            deadline = start + (step + 1) * self.float_time
+            # Drop frames whose slot has already passed, but always show the last one
+            if step < last_step and time.monotonic() > deadline:
+                continue
+
+            if drawn_step is None:
+                stdscr.erase()
+                first_row = 0
+            else:
+                # Every balloon rises by the same amount, so shift the previous frame up
+                # instead of erasing and redrawing it; only rows entering from below are new
+                shift = step - drawn_step
+                stdscr.move(0, 0)
+                stdscr.insdelln(-shift)
+                first_row = max(0, max_y - shift)
+            drawn_step = step
+
+            # All balloons share one row, so the visible slice of the art is the same too
+            y = y0 - step
+            rows = range(max(0, first_row - y), min(art_height, max_y - y))
+            for x0, art, color_pair in balloons:
+                for dy in rows:
+                    stdscr.addstr(y + dy, x0, art[dy], color_pair)
             stdscr.refresh()
-            time.sleep(self.float_time)
+
+            remaining = deadline - time.monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
 
     def _display_final_screen(
         self,
         stdscr: CursesWindow,
-        positions: List[Tuple[int, int, str, int]],
+        positions: Tuple[int, List[int]],
+        rendered: List[Tuple[str, ...]],
+        color_pairs: List[int],
         summary_lines: List[str],
     ) -> None:
         """Display the final screen with static balloons and summary."""
@@ -151,16 +232,16 @@ class BalloonVisualizer(Visualizer):
         stdscr.erase()
 
         # Draw balloons at final positions
-        for y0, x0, ch, idx in positions:
-            color_pair = curses.color_pair((idx % 5) + 1)
-            for dy, line in enumerate(BALLOON_ART):
+        y0, xs = positions
+        for x0, art, color_pair in zip(xs, rendered, color_pairs):
+            for dy, line in enumerate(art):
                 if y0 + dy < max_y and x0 < max_x:
-                    stdscr.addstr(y0 + dy, x0, line.format(ch), color_pair)
+                    stdscr.addstr(y0 + dy, x0, line, color_pair)
 
-        # Draw summary below balloons
-        y_start = max_y - len(BALLOON_ART) - len(summary_lines) - 2
+        # Draw summary below balloons, ending one line above the bottom edge
+        summary_top = max_y - len(summary_lines) - 1
         for i, line in enumerate(summary_lines):
-            stdscr.addstr(y_start + len(BALLOON_ART) + i + 1, 0, line)
+            stdscr.addstr(summary_top + i, 0, line)
         stdscr.refresh()
 
     def _wait_for_key(self, stdscr: CursesWindow) -> None:
@@ -184,7 +265,4 @@ class NoAnimationVisualizer(Visualizer):
         Args:
             result: The result object containing duplicates and other information.
         """
-        print("\nSummary:")
-        for line in result.get_summary_lines():
-            print(f"  {line}")
-        print("\n---\n")
+        _print_summary(result.get_summary_lines())
@@ -16,8 +16,14 @@ class Visualizer(ABC):
 
     Implementations of this interface can use different visualization strategies
     to display the results of duplicate character analysis.
+
+    Attributes:
+        animated: Whether this visualizer plays an animation, which callers may
+            want to skip for inputs that are too long to animate well.
     """
 
+    animated: bool = False
+
     @abstractmethod
     def visualize(self, result: DuplicateResult) -> None:
         """
@@ -0,0 +1,142 @@
+from typing import List, Optional, Tuple
+
+import pytest
+
+from src.ui import balloon_viz
+from src.ui.balloon_viz import BalloonVisualizer, _render_balloon
+
+Screen = List[List[Tuple[str, int]]]
+
+
+class FakeWindow:
+    """Minimal stand-in for a curses window that records the screen on each refresh."""
+
+    def __init__(self, max_y: int, max_x: int, clock: Optional["FakeClock"] = None) -> None:
+        self.max_y = max_y
+        self.max_x = max_x
+        self.clock = clock
+        self.cursor = (0, 0)
+        self.frames: List[Screen] = []
+        self.screen = blank_screen(max_y, max_x)
+
+    def getmaxyx(self) -> Tuple[int, int]:
+        return self.max_y, self.max_x
+
+    def idlok(self, flag: bool) -> None:
+        pass
+
+    def erase(self) -> None:
+        self.screen = blank_screen(self.max_y, self.max_x)
+
+    def move(self, y: int, x: int) -> None:
+        self.cursor = (y, x)
+
+    def insdelln(self, n: int) -> None:
+        # Only deletion is used: drop n lines at the cursor and blank the bottom
+        assert n < 0
+        row = self.cursor[0]
+        count = min(-n, self.max_y - row)
+        self.screen = (
+            self.screen[:row] + self.screen[row + count :] + blank_screen(count, self.max_x)
+        )
+
+    def addstr(self, y: int, x: int, text: str, attr: int = 0) -> None:
+        assert 0 <= y < self.max_y and 0 <= x < self.max_x
+        for i, ch in enumerate(text[: self.max_x - x]):
+            self.screen[y][x + i] = (ch, attr)
+
+    def refresh(self) -> None:
+        self.frames.append([row[:] for row in self.screen])
+        if self.clock:
+            self.clock.now += self.clock.frame_cost
+
+
+class FakeClock:
+    """Deterministic time source where each drawn frame costs a fixed amount of time."""
+
+    def __init__(self, frame_cost: float = 0.0) -> None:
+        self.now = 0.0
+        self.frame_cost = frame_cost
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def blank_screen(rows: int, cols: int) -> Screen:
+    return [[(" ", 0)] * cols for _ in range(rows)]
+
+
+def redraw_frame(
+    max_y: int, max_x: int, y0: int, xs: List[int], rendered: List[Tuple[str, ...]], step: int
+) -> Screen:
+    """Render one animation step the simple way: erase and draw every visible line."""
+    window = FakeWindow(max_y, max_x)
+    for idx, x0 in enumerate(xs):
+        if not 0 <= x0 < max_x:
+            continue
+        for dy, line in enumerate(rendered[idx]):
+            y = y0 - step + dy
+            if 0 <= y < max_y:
+                window.addstr(y, x0, line, idx + 1)
+    return window.screen
+
+
+@pytest.mark.parametrize(
+    "max_y,max_x,y0,xs,height,frame_cost",
+    [
+        (30, 60, 15, [0, 20, 40], 12, 0.0),
+        # Balloons rise past the top edge
+        (12, 40, 4, [0, 15], 12, 0.0),
+        # Balloons start partly below the bottom edge, one column is off screen
+        (10, 40, 6, [2, 18, 45], 8, 0.0),
+        # Drawing is slower than the frame time, so frames get dropped
+        (30, 60, 15, [0, 20, 40], 12, 2.5),
+        (12, 40, 4, [0, 15], 20, 1.7),
+    ],
+)  # type: ignore[misc]
+def test_animate_balloons_matches_full_redraw(
+    monkeypatch: pytest.MonkeyPatch,
+    max_y: int,
+    max_x: int,
+    y0: int,
+    xs: List[int],
+    height: int,
+    frame_cost: float,
+) -> None:
+    """
+    Test that the scrolling renderer shows the same frames as erasing and redrawing.
+
+    Args:
+        monkeypatch: Fixture used to replace the animation's time source.
+        max_y: Window height.
+        max_x: Window width.
+        y0: Row every balloon starts on.
+        xs: Column of each balloon.
+        height: Number of animation steps.
+        frame_cost: Simulated time spent drawing each frame, in frame times.
+    """
+    clock = FakeClock(frame_cost)
+    monkeypatch.setattr(balloon_viz.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(balloon_viz.time, "sleep", clock.sleep)
+
+    window = FakeWindow(max_y, max_x, clock)
+    rendered = [_render_balloon(ch) for ch in "abc"[: len(xs)]]
+    color_pairs = list(range(1, len(xs) + 1))
+    BalloonVisualizer(1.0, height)._animate_balloons(window, (y0, xs), rendered, color_pairs)
+
+    expected = [redraw_frame(max_y, max_x, y0, xs, rendered, step) for step in range(height)]
+
+    # Every frame shown must be a full-redraw frame, in order, ending on the last step
+    step = -1
+    for frame in window.frames:
+        later = [s for s in range(step + 1, height) if expected[s] == frame]
+        assert later, f"frame after step {step} matches no later full-redraw frame"
+        step = later[0]
+    assert window.frames[-1] == expected[-1]
+    if frame_cost > 1:
+        assert len(window.frames) < height
+    else:
+        assert window.frames == expected
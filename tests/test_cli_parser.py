@@ -17,6 +17,7 @@ def test_default_args() -> None:
     assert not args.no_animation
     assert not args.mem_profile
     assert args.input_file is None
+    assert not args.cache
 
 
 def test_verbose_flag() -> None:
@@ -55,9 +56,44 @@ def test_memory_profiling_flag() -> None:
     assert args.mem_profile
 
 
+def test_mem_profile_mode_flag() -> None:
+    """Test that the memory profiling backend is selected correctly."""
+    with patch.object(sys, "argv", ["main.py"]), patch.object(sys, "platform", "linux"):
+        args = parse_args()
+
+    assert args.mem_profile_mode == "rusage"
+
+    with patch.object(sys, "argv", ["main.py", "--mem-profile-mode", "tracemalloc"]):
+        args = parse_args()
+
+    assert args.mem_profile_mode == "tracemalloc"
+
+    with patch.object(sys, "argv", ["main.py", "--mem-profile-mode", "heap"]):
+        with pytest.raises(SystemExit):
+            parse_args()
+
+    # getrusage() does not exist on Windows, so only tracemalloc is accepted there
+    with patch.object(sys, "argv", ["main.py"]), patch.object(sys, "platform", "win32"):
+        args = parse_args()
+
+    assert args.mem_profile_mode == "tracemalloc"
+
+    with patch.object(sys, "argv", ["main.py", "--mem-profile-mode", "rusage"]):
+        with patch.object(sys, "platform", "win32"), pytest.raises(SystemExit):
+            parse_args()
+
+
 def test_input_file_arg() -> None:
     """Test that input file argument is set correctly."""
     with patch.object(sys, "argv", ["main.py", "--input-file", "inputs.txt"]):
         args = parse_args()
 
     assert args.input_file == "inputs.txt"
+
+
+def test_cache_flag() -> None:
+    """Test that the cache flag is set correctly."""
+    with patch.object(sys, "argv", ["main.py", "--cache"]):
+        args = parse_args()
+
+    assert args.cache
@@ -1,6 +1,11 @@
 import pytest
 
-from src.core.duplicate_finder import HistogramDuplicateFinder
+from src.core.duplicate_finder import (
+    LONG_INPUT_THRESHOLD,
+    CachedDuplicateFinder,
+    HistogramDuplicateFinder,
+    find_duplicates_fast,
+)
 
 
 @pytest.mark.parametrize(
@@ -24,6 +29,27 @@ def test_histogram_duplicate_finder(input_text: str, expected: list[str]) -> Non
     assert finder.find_duplicates(input_text) == expected
 
 
+@pytest.mark.parametrize(
+    "input_text,expected",
+    [
+        ("", []),
+        ("banana", ["a", "n"]),
+        ("a b a", ["a"]),
+        ("ééa a", ["é", "a"]),
+        ("abc " * 150, ["a", "b", "c"]),
+    ],
+)  # type: ignore[misc]
+def test_find_duplicates_fast(input_text: str, expected: list[str]) -> None:
+    """
+    Test the module-level find_duplicates_fast function with various inputs.
+
+    Args:
+        input_text: Input string to test.
+        expected: Expected list of duplicate characters.
+    """
+    assert find_duplicates_fast(input_text) == expected
+
+
 def test_type_error() -> None:
     """
     Test that HistogramDuplicateFinder raises TypeError for non-string inputs.
@@ -32,3 +58,83 @@ def test_type_error() -> None:
     with pytest.raises(TypeError):
         # We're intentionally passing an invalid type to test error handling
         finder.find_duplicates(123)  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    "input_text,expected",
+    [
+        ("\t\na\x0b\x0c\r\x1c\x1d\x1e\x1f a", ["a"]),
+        ("ééa a", ["é", "a"]),
+        ("nan　a n", ["n", "a"]),
+        ("é\x85é\u2028x\x85x", ["é", "x"]),
+    ],
+)  # type: ignore[misc]
+def test_whitespace_and_non_ascii(input_text: str, expected: list[str]) -> None:
+    """
+    Test that whitespace is skipped and first-seen order is kept for ASCII and non-ASCII inputs.
+
+    Args:
+        input_text: Input string to test.
+        expected: Expected list of duplicate characters.
+    """
+    finder = HistogramDuplicateFinder()
+    assert finder.find_duplicates(input_text) == expected
+
+
+@pytest.mark.parametrize(
+    "input_text,expected",
+    [
+        ("x" * 600 + "yz", ["x"]),
+        ("abc " * 150, ["a", "b", "c"]),
+        ("z" + "a" * 600 + "\tz", ["z", "a"]),
+        ("é" + "ab" * 300 + "é", ["é", "a", "b"]),
+        ("Nozomi Networks " * 40, ["N", "o", "z", "m", "i", "e", "t", "w", "r", "k", "s"]),
+        ("Nozomi Networks! " * 40, ["N", "o", "z", "m", "i", "e", "t", "w", "r", "k", "s", "!"]),
+    ],
+)  # type: ignore[misc]
+def test_long_inputs(input_text: str, expected: list[str]) -> None:
+    """
+    Test inputs longer than the long-input threshold.
+
+    Args:
+        input_text: Input string to test.
+        expected: Expected list of duplicate characters.
+    """
+    assert len(input_text) >= LONG_INPUT_THRESHOLD
+    finder = HistogramDuplicateFinder()
+    assert finder.find_duplicates(input_text) == expected
+
+
+def test_cached_finder() -> None:
+    """
+    Test that CachedDuplicateFinder reuses results for repeated inputs.
+    """
+    finder = CachedDuplicateFinder(HistogramDuplicateFinder())
+    first = finder.find_duplicates("banana")
+    first.append("x")
+
+    assert finder.find_duplicates("banana") == ["a", "n"]
+    assert finder._cached_find.cache_info().hits == 1
+
+    finder.cache_clear()
+    assert finder._cached_find.cache_info().currsize == 0
+
+
+def test_cached_finder_skips_long_inputs() -> None:
+    """
+    Test that CachedDuplicateFinder does not keep long inputs alive in the cache.
+    """
+    finder = CachedDuplicateFinder(HistogramDuplicateFinder())
+    text = "abc " * 150
+
+    assert finder.find_duplicates(text) == ["a", "b", "c"]
+    assert finder._cached_find.cache_info().currsize == 0
+
+
+def test_cached_finder_type_error() -> None:
+    """
+    Test that CachedDuplicateFinder raises TypeError for non-string inputs.
+    """
+    finder = CachedDuplicateFinder(HistogramDuplicateFinder())
+    with pytest.raises(TypeError):
+        finder.find_duplicates(["a", "a"])  # type: ignore[arg-type]
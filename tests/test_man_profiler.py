@@ -1,4 +1,18 @@
-from src.profiling.memory_profiler import MemoryProfiler, MemoryStats
+import resource
+import sys
+from types import SimpleNamespace
+from typing import Iterator
+
+import pytest
+
+from src.profiling import memory_profiler
+from src.profiling.memory_profiler import MemoryProfiler, MemoryStats, RusageProfiler, _max_rss
+
+
+def fake_max_rss(monkeypatch: pytest.MonkeyPatch, *samples: int) -> None:
+    """Make _max_rss return the given peak RSS samples, in bytes, one per call."""
+    values: Iterator[int] = iter(samples)
+    monkeypatch.setattr(memory_profiler, "_max_rss", lambda: next(values))
 
 
 def test_memory_profiler() -> None:
@@ -22,3 +36,89 @@ def test_memory_profiler() -> None:
 
     # Force garbage collection to clean up
     del big_list
+
+
+def test_rusage_profiler(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that RusageProfiler reports peak RSS growth."""
+    fake_max_rss(monkeypatch, 10_000, 15_000)
+    profiler = RusageProfiler()
+
+    profiler.start()
+    stats = profiler.stop()
+
+    assert stats == MemoryStats(current=5_000, peak=15_000)
+
+
+@pytest.mark.parametrize(
+    "platform,ru_maxrss,expected",
+    [("linux", 2048, 2048 * 1024), ("darwin", 2048, 2048)],
+)  # type: ignore[misc]
+def test_max_rss_units(
+    monkeypatch: pytest.MonkeyPatch, platform: str, ru_maxrss: int, expected: int
+) -> None:
+    """
+    Test that the peak RSS is converted to bytes on each platform.
+
+    Args:
+        monkeypatch: Fixture used to fake the platform and getrusage().
+        platform: Value of sys.platform to simulate.
+        ru_maxrss: Raw value reported by getrusage().
+        expected: Expected peak RSS in bytes.
+    """
+    monkeypatch.setattr(sys, "platform", platform)
+    monkeypatch.setattr(resource, "getrusage", lambda who: SimpleNamespace(ru_maxrss=ru_maxrss))
+
+    assert _max_rss() == expected
+
+
+def test_memory_profiler_sections() -> None:
+    """Test that reset_peak and snapshot measure sections without restarting tracking."""
+    profiler = MemoryProfiler()
+    profiler.start()
+    retained = [0] * 1000000
+
+    # A new section should not count the list allocated before it
+    profiler.reset_peak()
+    stats = profiler.snapshot()
+    assert stats.current < 4096
+
+    section_list = [0] * 1000000
+    stats = profiler.snapshot()
+    assert stats.current > 0
+    assert stats.peak >= stats.current
+
+    # Freeing memory allocated before the section must not report negative usage
+    del retained, section_list
+    stats = profiler.snapshot()
+    assert stats.current == 0
+
+    profiler.stop()
+
+
+def test_memory_profiler_section_without_start() -> None:
+    """Test that reset_peak starts tracking when the caller did not call start."""
+    profiler = MemoryProfiler()
+    profiler.reset_peak()
+
+    section_list = [0] * 1000000
+    stats = profiler.snapshot()
+    assert stats.current > 0
+
+    profiler.stop()
+    del section_list
+
+
+def test_rusage_profiler_sections(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that RusageProfiler reports per-section peak RSS growth."""
+    fake_max_rss(monkeypatch, 10_000, 12_000, 20_000, 20_000, 20_000, 20_000)
+    profiler = RusageProfiler()
+    profiler.start()
+
+    profiler.reset_peak()
+    assert profiler.snapshot() == MemoryStats(current=8_000, peak=20_000)
+
+    # A section that does not raise the process peak reports no growth
+    profiler.reset_peak()
+    assert profiler.snapshot() == MemoryStats(current=0, peak=20_000)
+
+    assert profiler.stop() == MemoryStats(current=0, peak=20_000)
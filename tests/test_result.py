@@ -45,3 +45,18 @@ def test_summary_lines_with_memory() -> None:
     assert "1.00 KiB" in lines[4]
     assert "Memory peak usage" in lines[5]
     assert "2.00 KiB" in lines[5]
+
+
+def test_summary_lines_with_memory_labels() -> None:
+    """Test that summary lines use the labels of the profiler that produced the stats."""
+    result = DuplicateResult(
+        input_text="hello",
+        duplicates=["l"],
+        duration=0.0001,
+        memory_stats=(0, 4096),
+        memory_labels=("Peak RSS growth", "Process peak RSS"),
+    )
+
+    lines = result.get_summary_lines()
+    assert lines[4] == "Peak RSS growth        : 0.00 KiB"
+    assert lines[5] == "Process peak RSS       : 4.00 KiB"